@@ -9,17 +9,24 @@ import click
 from grv.config import extract_repo_id, get_grv_root
 from grv.constants import (
     DEFAULT_SHELL,
+    MAX_SCAN_WORKERS,
     REPOS_DIR,
     SHELL_ENV_VAR,
     TREE_BRANCHES_DIR,
     TRUNK_DIR,
 )
-from grv.git import ensure_base_repo, ensure_worktree, get_default_branch
+from grv.git import (
+    ensure_base_repo,
+    ensure_worktree,
+    get_default_branch,
+    remove_worktrees,
+)
 from grv.pr import is_pr_url, resolve_pr
 from grv.status import (
     BranchStatus,
     get_all_repos,
     get_branch_status,
+    get_repo_branch_metadata,
     get_repo_branches_fast,
 )
 
@@ -140,11 +147,15 @@ def dir_cmd(
     click.echo(str(tree_path))
 
 
+def _repo_root(tree_path: Path, branch_name: str) -> Path:
+    """Get the repo root of a worktree at <repo>/tree_branches/<branch>."""
+    # Branch names with slashes nest one directory per component
+    return tree_path.parents[len(Path(branch_name).parts)]
+
+
 def _clean_branch(path: Path, branch_name: str, force: bool = False) -> bool:
     """Clean a single branch if safe. Returns True if cleaned."""
-    # Find trunk path
-    idx = path.parts.index(TREE_BRANCHES_DIR)
-    repo_root = Path(*path.parts[:idx])
+    repo_root = _repo_root(path, branch_name)
     trunk_path = repo_root / TRUNK_DIR
 
     status = get_branch_status(path, trunk_path, branch_name)
@@ -164,13 +175,17 @@ def _clean_branch(path: Path, branch_name: str, force: bool = False) -> bool:
     else:
         click.secho(f"\nCleaning '{branch_name}'...", fg="green")
 
-    # Remove worktree and branch
-    for cmd in [
-        ["git", "worktree", "remove", "--force" if force else "", str(path)],
-        ["git", "branch", "-D" if force else "-d", branch_name],
-    ]:
-        cmd = [c for c in cmd if c]  # Filter empty strings
-        subprocess.run(cmd, cwd=trunk_path, capture_output=True)
+    # Remove worktree, then its branch only if the worktree is gone
+    worktree_cmd = ["git", "worktree", "remove", "--force" if force else "", str(path)]
+    result = subprocess.run(
+        [c for c in worktree_cmd if c], cwd=trunk_path, capture_output=True
+    )
+    if result.returncode == 0:
+        subprocess.run(
+            ["git", "branch", "-D" if force else "-d", branch_name],
+            cwd=trunk_path,
+            capture_output=True,
+        )
 
     # Check if repo is now empty
     if not get_repo_branches_fast(repo_root):
@@ -214,26 +229,46 @@ def list_cmd() -> None:
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation prompt")
 def clean(dry_run: bool, force: bool) -> None:
     """Remove worktrees that are safe to clean."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     repos = get_all_repos()
     if not repos:
         click.secho("No repositories to scan.", fg="yellow")
         return
 
-    # Collect all branches first (fast)
-    all_branches = [(r, b) for _, r in repos for b in get_repo_branches_fast(r)]
+    # Collect all branches first (fast, one git worktree list per repo)
+    repo_paths = [r for _, r in repos]
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        branch_lists = list(executor.map(get_repo_branches_fast, repo_paths))
+    all_branches = [
+        (r, b) for r, bs in zip(repo_paths, branch_lists, strict=True) for b in bs
+    ]
     total = len(all_branches)
     if not total:
         click.secho("No branches to scan.", fg="yellow")
         return
 
-    to_clean: list[BranchStatus] = []
-    for i, (repo_path, branch) in enumerate(all_branches, 1):
-        click.echo(f"\rScanning branch {i}/{total}...", nl=False)
-        status = get_branch_status(branch.path, repo_path / TRUNK_DIR, branch.name)
-        if status.is_safe_to_clean:
-            to_clean.append(status)
+    # git subprocesses release the GIL, so threads scan branches concurrently
+    scanned = [r for r, bs in zip(repo_paths, branch_lists, strict=True) if bs]
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, total)) as executor:
+        trunks = [r / TRUNK_DIR for r in scanned]
+        metadata = dict(
+            zip(scanned, executor.map(get_repo_branch_metadata, trunks), strict=True)
+        )
+        futures = [
+            executor.submit(
+                get_branch_status, b.path, r / TRUNK_DIR, b.name, metadata[r]
+            )
+            for r, b in all_branches
+        ]
+        for i, _ in enumerate(as_completed(futures), 1):
+            click.echo(f"\rScanning branch {i}/{total}...", nl=False)
     click.echo(f"\rScanning branch {total}/{total}... done")
 
+    to_clean: list[BranchStatus] = [
+        status for f in futures if (status := f.result()).is_safe_to_clean
+    ]
+
     if not to_clean:
         click.secho("Nothing to clean.", fg="green")
         return
@@ -249,17 +284,14 @@ def clean(dry_run: bool, force: bool) -> None:
     if not force:
         click.confirm(f"\nRemove {len(to_clean)} worktree(s)?", abort=True)
     click.echo("")
-    affected_repos: set[Path] = set()
+    affected_repos: dict[Path, list[BranchStatus]] = {}
     for b in to_clean:
-        idx = b.path.parts.index(TREE_BRANCHES_DIR)
-        repo_root = Path(*b.path.parts[:idx])
-        affected_repos.add(repo_root)
-        click.echo(f"  Removing {click.style(b.name, fg='cyan')}...", nl=False)
-        for cmd in [
-            ["git", "worktree", "remove", str(b.path)],
-            ["git", "branch", "-d", b.name],
-        ]:
-            subprocess.run(cmd, cwd=repo_root / TRUNK_DIR, capture_output=True)
+        affected_repos.setdefault(_repo_root(b.path, b.name), []).append(b)
+
+    for repo_root, branches in affected_repos.items():
+        names = ", ".join(click.style(b.name, fg="cyan") for b in branches)
+        click.echo(f"  Removing {names}...", nl=False)
+        remove_worktrees(repo_root / TRUNK_DIR, [(b.path, b.name) for b in branches])
         click.secho(" done", fg="green")
 
     repos_removed = 0
@@ -1,8 +1,17 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
-from grv.constants import DEFAULT_GRV_ROOT, GIT_SSH_PREFIX, GIT_SUFFIX
+from grv.constants import (
+    DEFAULT_GRV_ROOT,
+    GIT_SSH_PREFIX,
+    GIT_SUFFIX,
+    REPO_ID_CACHE_SIZE,
+)
+
+# Characters in a repo URL that become "_" in its repo ID
+_REPO_ID_TABLE = str.maketrans("./:", "___")
 
 
 def get_grv_root() -> Path:
@@ -11,6 +20,7 @@ def get_grv_root() -> Path:
     return Path(root)
 
 
+@lru_cache(maxsize=REPO_ID_CACHE_SIZE)
 def extract_repo_id(repo: str) -> str:
     """Extract a unique repository identifier from a git URL.
 
@@ -28,4 +38,4 @@ def extract_repo_id(repo: str) -> str:
     else:
         raw_id = repo.rstrip("/").removesuffix(GIT_SUFFIX).lstrip("/")
 
-    return raw_id.replace(".", "_").replace("/", "_").replace(":", "_")
+    return raw_id.translate(_REPO_ID_TABLE)
@@ -8,12 +8,31 @@ TREE_BRANCHES_DIR = "tree_branches"
 
 # Git constants
 GIT_DIR = ".git"
+GIT_DIR_FILE_PREFIX = "gitdir:"
+GIT_COMMONDIR_FILE = "commondir"
+GIT_SYMREF_PREFIX = "ref:"
 GIT_SUFFIX = ".git"
 GIT_SSH_PREFIX = "git@"
 GIT_REMOTE_NAME = "origin"
 GIT_CLONE_FILTER = "--filter=blob:none"
 GIT_REF_REMOTE_HEAD = "refs/remotes/origin/HEAD"
 GIT_REF_HEADS_FMT = "refs/heads/{branch}"
+GIT_REFS_HEADS_PREFIX = "refs/heads/"
+GIT_REFS_REMOTE_PREFIX = "refs/remotes/origin/"
+GIT_REF_TRACK_FORMAT = "--format=%(refname)%00%(upstream)%00%(upstream:track)"
+GIT_SHORT_REF_FORMAT = "--format=%(refname:short)"
+GIT_REFNAME_FORMAT = "--format=%(refname)"
+GIT_REF_FIELD_SEP = "\0"
+GIT_NUMSTAT_SEP = "\t"
+
+# Upper bound on concurrent branch status scans
+MAX_SCAN_WORKERS = 32
+
+# Memoized repo IDs (one per distinct repo URL)
+REPO_ID_CACHE_SIZE = 256
+
+# Memoized default branches (one per trunk/worktree path)
+DEFAULT_BRANCH_CACHE_SIZE = 64
 
 # Shell environment
 SHELL_ENV_VAR = "SHELL"
@@ -27,9 +46,8 @@ TREE_INDENT = "│   "
 TREE_LAST_BRANCH = "└─"
 TREE_BRANCH = "├─"
 
-# Regex patterns for git diff parsing
-INSERTION_PATTERN = r"(\d+) insertion"
-DELETION_PATTERN = r"(\d+) deletion"
+# Regex pattern for `%(upstream:track)` parsing
+AHEAD_PATTERN = r"ahead (\d+)"
 
 # Menu styling
 MENU_CURSOR_STYLE = ("fg_cyan", "bold")
@@ -1,14 +1,21 @@
+import shlex
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import click
 
 from grv.constants import (
+    DEFAULT_BRANCH_CACHE_SIZE,
     GIT_CLONE_FILTER,
     GIT_REF_HEADS_FMT,
     GIT_REF_REMOTE_HEAD,
+    GIT_REFNAME_FORMAT,
+    GIT_REFS_REMOTE_PREFIX,
     GIT_REMOTE_NAME,
+    GIT_SYMREF_PREFIX,
 )
+from grv.gitdir import common_git_dir
 
 
 def run_git(
@@ -22,19 +29,59 @@ def run_git(
 
 
 def get_default_branch(repo_path: Path) -> str:
-    """Get the default branch name (main or master)."""
+    """Get the default branch name (main or master).
+
+    Reads the origin/HEAD symref file directly and memoizes the result until
+    the file changes, falling back to git when it is missing.
+    """
+    ref_file = common_git_dir(repo_path) / GIT_REF_REMOTE_HEAD
+    try:
+        mtime_ns = ref_file.stat().st_mtime_ns
+    except OSError:
+        return _query_default_branch(repo_path)
+    return _read_default_branch(repo_path, ref_file, mtime_ns)
+
+
+@lru_cache(maxsize=DEFAULT_BRANCH_CACHE_SIZE)
+def _read_default_branch(repo_path: Path, ref_file: Path, _mtime_ns: int) -> str:
+    ref = ref_file.read_text()
+    if not ref.startswith(GIT_SYMREF_PREFIX):
+        return _query_default_branch(repo_path)
+    return ref.strip().split("/")[-1]
+
+
+def _query_default_branch(repo_path: Path) -> str:
     result = run_git("symbolic-ref", GIT_REF_REMOTE_HEAD, cwd=repo_path, capture=True)
     return result.stdout.strip().split("/")[-1]
 
 
-def branch_exists_locally(base_path: Path, branch: str) -> bool:
-    """Check if a branch exists locally."""
-    ref = GIT_REF_HEADS_FMT.format(branch=branch)
-    result = subprocess.run(
-        ["git", "show-ref", "--verify", "--quiet", ref],
+def branch_refs(base_path: Path, branch: str) -> tuple[bool, bool]:
+    """Check whether a branch exists (locally, on origin) with one git call."""
+    local_ref = GIT_REF_HEADS_FMT.format(branch=branch)
+    remote_ref = f"{GIT_REFS_REMOTE_PREFIX}{branch}"
+    result = run_git(
+        "for-each-ref",
+        GIT_REFNAME_FORMAT,
+        local_ref,
+        remote_ref,
         cwd=base_path,
+        capture=True,
     )
-    return result.returncode == 0
+    refs = set(result.stdout.split())
+    return local_ref in refs, remote_ref in refs
+
+
+def remove_worktrees(
+    base_path: Path, worktrees: list[tuple[Path, str]], force: bool = False
+) -> None:
+    """Remove worktrees and their branches with a single shell invocation."""
+    remove = "git worktree remove --force" if force else "git worktree remove"
+    delete = "git branch -D" if force else "git branch -d"
+    script = "; ".join(
+        f"{remove} {shlex.quote(str(path))} && {delete} {shlex.quote(branch)}"
+        for path, branch in worktrees
+    )
+    subprocess.run(["sh", "-c", script], cwd=base_path, capture_output=True)
 
 
 def ensure_base_repo(repo_url: str, base_path: Path) -> None:
@@ -42,18 +89,15 @@ def ensure_base_repo(repo_url: str, base_path: Path) -> None:
     if base_path.exists():
         click.secho("Fetching latest changes...", fg="blue", err=True)
         run_git("fetch", "--all", "--prune", cwd=base_path)
-        default_branch = get_default_branch(base_path)
-        detach_ref = f"{GIT_REMOTE_NAME}/{default_branch}"
-        run_git("checkout", "--detach", detach_ref, cwd=base_path)
     else:
         click.secho(
             "Cloning repository (this may take a moment)...", fg="blue", err=True
         )
         base_path.parent.mkdir(parents=True, exist_ok=True)
         run_git("clone", GIT_CLONE_FILTER, repo_url, str(base_path))
-        default_branch = get_default_branch(base_path)
-        detach_ref = f"{GIT_REMOTE_NAME}/{default_branch}"
-        run_git("checkout", "--detach", detach_ref, cwd=base_path)
+    default_branch = get_default_branch(base_path)
+    detach_ref = f"{GIT_REMOTE_NAME}/{default_branch}"
+    run_git("checkout", "--detach", detach_ref, cwd=base_path)
 
 
 def ensure_worktree(
@@ -75,15 +119,12 @@ def ensure_worktree(
     click.secho(f"Setting up worktree for '{branch}'...", fg="blue", err=True)
     tree_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if branch_exists_locally(base_path, branch):
+    local_exists, remote_exists = branch_refs(base_path, branch)
+    if local_exists:
         run_git("worktree", "add", str(tree_path), branch, cwd=base_path)
         return
 
-    result = run_git(
-        "ls-remote", "--heads", GIT_REMOTE_NAME, branch, cwd=base_path, capture=True
-    )
-
-    if result.stdout.strip():
+    if remote_exists:
         run_git(
             "worktree",
             "add",
@@ -0,0 +1,23 @@
+"""Locate git directories on disk without spawning git."""
+
+from pathlib import Path
+
+from grv.constants import GIT_COMMONDIR_FILE, GIT_DIR, GIT_DIR_FILE_PREFIX
+
+
+def resolve_git_dir(checkout_path: Path) -> Path:
+    """Get the git directory of a checkout, following a worktree's gitdir file."""
+    dot_git = checkout_path / GIT_DIR
+    if dot_git.is_file():
+        gitdir = dot_git.read_text().removeprefix(GIT_DIR_FILE_PREFIX).strip()
+        return checkout_path / gitdir
+    return dot_git
+
+
+def common_git_dir(checkout_path: Path) -> Path:
+    """Get the git directory holding shared refs (the trunk's, for worktrees)."""
+    git_dir = resolve_git_dir(checkout_path)
+    commondir = git_dir / GIT_COMMONDIR_FILE
+    if commondir.is_file():
+        return git_dir / commondir.read_text().strip()
+    return git_dir
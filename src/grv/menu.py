@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -8,6 +9,7 @@ from simple_term_menu import TerminalMenu  # type: ignore[import-untyped]
 from grv.config import get_grv_root
 from grv.constants import (
     DEFAULT_SHELL,
+    MAX_SCAN_WORKERS,
     MENU_CURSOR_STYLE,
     SHELL_ENV_VAR,
     TREE_BRANCH,
@@ -35,10 +37,15 @@ class MenuAction(Enum):
 def build_menu_entries() -> list[tuple[str, BranchInfo | None]]:
     """Build menu entries: (display, branch_info). None = repo header."""
     entries: list[tuple[str, BranchInfo | None]] = []
-    repos = [(n, p) for n, p in get_all_repos() if get_repo_branches_fast(p)]
-
-    for ri, (repo_name, repo_path) in enumerate(repos):
-        branches = get_repo_branches_fast(repo_path)
+    all_repos = get_all_repos()
+    # Each lookup runs git worktree list; threads overlap the subprocesses
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        branch_lists = executor.map(get_repo_branches_fast, [p for _, p in all_repos])
+        repos = [
+            (n, bs) for (n, _), bs in zip(all_repos, branch_lists, strict=True) if bs
+        ]
+
+    for ri, (repo_name, branches) in enumerate(repos):
         is_last_repo = ri == len(repos) - 1
         repo_prefix = TREE_LAST_ITEM if is_last_repo else TREE_ITEM
         entries.append((f"{repo_prefix}{repo_name}", None))
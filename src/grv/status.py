@@ -1,4 +1,5 @@
 # loc-skip
+import os
 import re
 import subprocess
 from dataclasses import dataclass
@@ -6,15 +7,22 @@ from pathlib import Path
 
 from grv.config import get_grv_root
 from grv.constants import (
-    DELETION_PATTERN,
+    AHEAD_PATTERN,
+    GIT_NUMSTAT_SEP,
+    GIT_REF_FIELD_SEP,
+    GIT_REF_TRACK_FORMAT,
+    GIT_REFS_HEADS_PREFIX,
+    GIT_REFS_REMOTE_PREFIX,
     GIT_REMOTE_NAME,
-    INSERTION_PATTERN,
+    GIT_SHORT_REF_FORMAT,
     REPOS_DIR,
     TREE_BRANCHES_DIR,
     TRUNK_DIR,
 )
 from grv.git import get_default_branch
 
+_AHEAD_RE = re.compile(AHEAD_PATTERN)
+
 
 @dataclass
 class BranchInfo:
@@ -47,67 +55,130 @@ class BranchStatus:
         )
 
 
-def get_branch_status(tree_path: Path, trunk_path: Path, branch: str) -> BranchStatus:
-    """Get status information for a worktree branch."""
+@dataclass
+class BranchRefs:
+    """Remote and merge state for a local branch, read from the trunk's refs."""
+
+    has_remote: bool
+    is_merged: bool
+    ahead: int | None  # None when the upstream is not origin/<branch>
+
+
+def get_repo_branch_metadata(trunk_path: Path) -> dict[str, BranchRefs]:
+    """Get remote/merge state for every local branch in three git calls."""
+    default_branch = get_default_branch(trunk_path)
     result = subprocess.run(
-        ["git", "ls-remote", "--heads", GIT_REMOTE_NAME, branch],
+        [
+            "git",
+            "branch",
+            "--merged",
+            f"{GIT_REMOTE_NAME}/{default_branch}",
+            GIT_SHORT_REF_FORMAT,
+        ],
         cwd=trunk_path,
         capture_output=True,
         text=True,
     )
-    has_remote = bool(result.stdout.strip())
+    merged = set(result.stdout.split())
 
-    default_branch = get_default_branch(trunk_path)
+    # Ask the remote itself: local remote-tracking refs go stale when a
+    # branch is deleted upstream, and clean never fetches
     result = subprocess.run(
-        ["git", "branch", "--merged", f"{GIT_REMOTE_NAME}/{default_branch}"],
-        cwd=tree_path,
+        ["git", "ls-remote", "--heads", GIT_REMOTE_NAME],
+        cwd=trunk_path,
         capture_output=True,
         text=True,
     )
-    merged = [b.strip().lstrip("* ") for b in result.stdout.strip().split("\n")]
-    is_merged = branch in merged
+    remote_heads = {
+        line.split()[-1].removeprefix(GIT_REFS_HEADS_PREFIX)
+        for line in result.stdout.splitlines()
+    }
 
-    if has_remote:
-        result = subprocess.run(
-            ["git", "rev-list", "--count", f"{GIT_REMOTE_NAME}/{branch}..{branch}"],
-            cwd=tree_path,
-            capture_output=True,
-            text=True,
+    result = subprocess.run(
+        ["git", "for-each-ref", GIT_REF_TRACK_FORMAT, GIT_REFS_HEADS_PREFIX],
+        cwd=trunk_path,
+        capture_output=True,
+        text=True,
+    )
+    rows = [line.split(GIT_REF_FIELD_SEP) for line in result.stdout.splitlines()]
+
+    metadata = {}
+    for ref, upstream, track in rows:
+        name = ref.removeprefix(GIT_REFS_HEADS_PREFIX)
+        has_remote = name in remote_heads
+        ahead = None
+        if has_remote and upstream == f"{GIT_REFS_REMOTE_PREFIX}{name}":
+            ahead = int(m.group(1)) if (m := _AHEAD_RE.search(track)) else 0
+        metadata[name] = BranchRefs(
+            has_remote=has_remote, is_merged=name in merged, ahead=ahead
         )
-        unpushed = int(result.stdout.strip()) if result.returncode == 0 else 0
-    else:
-        rev_range = f"{GIT_REMOTE_NAME}/{default_branch}..{branch}"
+    return metadata
+
+
+def _count_diff_lines(tree_path: Path) -> tuple[int, int]:
+    """Count (insertions, deletions) of uncommitted changes in a worktree."""
+    # Exit status only; stale stat info can report a clean tree as dirty,
+    # never the reverse, so a dirty result just falls through to the count
+    quiet = subprocess.run(
+        ["git", "diff-index", "--quiet", "HEAD"], cwd=tree_path, capture_output=True
+    )
+    if quiet.returncode == 0:
+        return 0, 0
+
+    result = subprocess.run(
+        ["git", "diff", "--numstat", "HEAD"],
+        cwd=tree_path,
+        capture_output=True,
+        text=True,
+    )
+    insertions, deletions = 0, 0
+    for line in result.stdout.splitlines():
+        added, removed, _ = line.split(GIT_NUMSTAT_SEP, 2)
+        # Binary files report "-" for both counts
+        if added.isdigit():
+            insertions += int(added)
+        if removed.isdigit():
+            deletions += int(removed)
+    return insertions, deletions
+
+
+def get_branch_status(
+    tree_path: Path,
+    trunk_path: Path,
+    branch: str,
+    metadata: dict[str, BranchRefs] | None = None,
+) -> BranchStatus:
+    """Get status information for a worktree branch.
+
+    Pass `metadata` from get_repo_branch_metadata to share one ref scan
+    across all branches of a repo.
+    """
+    if metadata is None:
+        metadata = get_repo_branch_metadata(trunk_path)
+    refs = metadata.get(
+        branch, BranchRefs(has_remote=False, is_merged=False, ahead=None)
+    )
+
+    unpushed = refs.ahead
+    if unpushed is None:
+        base = branch if refs.has_remote else get_default_branch(trunk_path)
         result = subprocess.run(
-            ["git", "rev-list", "--count", rev_range],
+            ["git", "rev-list", "--count", f"{GIT_REMOTE_NAME}/{base}..{branch}"],
             cwd=tree_path,
             capture_output=True,
             text=True,
         )
         unpushed = int(result.stdout.strip()) if result.returncode == 0 else 0
 
-    result = subprocess.run(
-        ["git", "diff", "--stat", "HEAD"],
-        cwd=tree_path,
-        capture_output=True,
-        text=True,
-    )
-    uncommitted, insertions, deletions = 0, 0, 0
-    if result.stdout.strip():
-        summary = result.stdout.strip().split("\n")[-1]
-        if "insertion" in summary or "deletion" in summary:
-            ins = re.search(INSERTION_PATTERN, summary)
-            dels = re.search(DELETION_PATTERN, summary)
-            insertions = int(ins.group(1)) if ins else 0
-            deletions = int(dels.group(1)) if dels else 0
-            uncommitted = insertions + deletions
+    insertions, deletions = _count_diff_lines(tree_path)
 
     return BranchStatus(
         name=branch,
         path=tree_path,
-        has_remote=has_remote,
-        is_merged=is_merged,
+        has_remote=refs.has_remote,
+        is_merged=refs.is_merged,
         unpushed_commits=unpushed,
-        uncommitted_changes=uncommitted,
+        uncommitted_changes=insertions + deletions,
         insertions=insertions,
         deletions=deletions,
     )
@@ -116,13 +187,17 @@ def get_branch_status(tree_path: Path, trunk_path: Path, branch: str) -> BranchS
 def get_all_repos() -> list[tuple[str, Path]]:
     """Get all repos in the workspace."""
     repos_dir = get_grv_root() / REPOS_DIR
-    if not repos_dir.exists():
+    try:
+        # DirEntry.is_dir() reuses the file type from readdir, saving a stat
+        with os.scandir(repos_dir) as entries:
+            repos = [
+                (entry.name, Path(entry.path))
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, TRUNK_DIR))
+            ]
+    except FileNotFoundError:
         return []
-
-    repos = []
-    for repo_dir in repos_dir.iterdir():
-        if repo_dir.is_dir() and (repo_dir / TRUNK_DIR).exists():
-            repos.append((repo_dir.name, repo_dir))
     return sorted(repos)
 
 
@@ -136,7 +211,7 @@ def _find_worktrees(repo_path: Path) -> list[tuple[str, Path]]:
     trunk_path = repo_path / TRUNK_DIR
     tree_branches_dir = repo_path / TREE_BRANCHES_DIR
 
-    if not trunk_path.exists():
+    if not trunk_path.exists() or not tree_branches_dir.exists():
         return []
 
     # Use git worktree list to get all worktrees
@@ -156,13 +231,12 @@ def _find_worktrees(repo_path: Path) -> list[tuple[str, Path]]:
         if line.startswith("worktree "):
             worktree_path = Path(line[9:])  # Skip "worktree " prefix
             # Only include worktrees under tree_branches/
-            if tree_branches_dir.exists():
-                try:
-                    branch_name = str(worktree_path.relative_to(tree_branches_dir))
-                    result.append((branch_name, worktree_path))
-                except ValueError:
-                    # Path is not under tree_branches_dir (e.g., trunk)
-                    pass
+            try:
+                branch_name = str(worktree_path.relative_to(tree_branches_dir))
+                result.append((branch_name, worktree_path))
+            except ValueError:
+                # Path is not under tree_branches_dir (e.g., trunk)
+                pass
 
     return sorted(result)
 
@@ -170,10 +244,14 @@ def _find_worktrees(repo_path: Path) -> list[tuple[str, Path]]:
 def get_repo_branches(repo_path: Path) -> list[BranchStatus]:
     """Get all branches for a repo with their status (slow, uses git)."""
     trunk_path = repo_path / TRUNK_DIR
+    worktrees = _find_worktrees(repo_path)
+    if not worktrees:
+        return []
+    metadata = get_repo_branch_metadata(trunk_path)
     return sorted(
         [
-            get_branch_status(path, trunk_path, name)
-            for name, path in _find_worktrees(repo_path)
+            get_branch_status(path, trunk_path, name, metadata)
+            for name, path in worktrees
         ],
         key=lambda b: b.name,
     )
@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
@@ -163,12 +163,17 @@ class TestList:
             ),
             patch("grv.cli.get_branch_status", return_value=safe_status),
             patch("grv.cli.get_repo_branches_fast", return_value=[]),
-            patch("subprocess.run"),
+            patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
         ):
             result = runner.invoke(main, ["list"])
             assert "Cleaning 'feature'" in result.output
             assert "Removing empty repo" in result.output
             assert "Done" in result.output
+            assert not repo_path.exists()
+            assert [c.args[0] for c in mock_run.call_args_list] == [
+                ["git", "worktree", "remove", str(branch_path)],
+                ["git", "branch", "-d", "feature"],
+            ]
 
     def test_list_clean_action_safe_keeps_nonempty_repo(
         self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -321,11 +326,47 @@ class TestList:
             ),
             patch("grv.cli.get_branch_status", return_value=unsafe_status),
             patch("grv.cli.get_repo_branches_fast", return_value=[]),
-            patch("subprocess.run"),
+            patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
         ):
             result = runner.invoke(main, ["list"], input="y\n")
             assert "Force deleting 'feature'" in result.output
             assert "Done" in result.output
+            assert [c.args[0] for c in mock_run.call_args_list] == [
+                ["git", "worktree", "remove", "--force", str(branch_path)],
+                ["git", "branch", "-D", "feature"],
+            ]
+
+    def test_list_clean_action_keeps_branch_when_removal_fails(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GRV_ROOT", str(tmp_path))
+        repo_path = tmp_path / "repo"
+        branch_path = repo_path / "tree_branches" / "feature"
+        branch_path.mkdir(parents=True)
+        (repo_path / "trunk").mkdir(parents=True)
+        safe_status = BranchStatus(
+            name="feature",
+            path=branch_path,
+            has_remote=True,
+            is_merged=True,
+            unpushed_commits=0,
+            uncommitted_changes=0,
+            insertions=0,
+            deletions=0,
+        )
+        with (
+            patch("grv.cli.get_all_repos", return_value=[("repo", repo_path)]),
+            patch(
+                "grv.menu.interactive_select",
+                return_value=(branch_path, "feature", MenuAction.CLEAN),
+            ),
+            patch("grv.cli.get_branch_status", return_value=safe_status),
+            patch("grv.cli.get_repo_branches_fast", return_value=[]),
+            patch("subprocess.run", return_value=MagicMock(returncode=1)) as mock_run,
+        ):
+            runner.invoke(main, ["list"])
+            mock_run.assert_called_once()
+            assert mock_run.call_args.args[0][:3] == ["git", "worktree", "remove"]
 
     def test_list_delete_action_declined(
         self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -381,6 +422,7 @@ class TestClean:
         with (
             patch("grv.cli.get_all_repos", return_value=[("repo", tmp_path)]),
             patch("grv.cli.get_repo_branches_fast", return_value=[branch_info]),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", return_value=unsafe_status),
         ):
             result = runner.invoke(main, ["clean"])
@@ -404,6 +446,7 @@ class TestClean:
         with (
             patch("grv.cli.get_all_repos", return_value=[("repo", tmp_path)]),
             patch("grv.cli.get_repo_branches_fast", return_value=[branch_info]),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", return_value=safe_status),
         ):
             result = runner.invoke(main, ["clean", "--dry-run"])
@@ -431,12 +474,43 @@ class TestClean:
         with (
             patch("grv.cli.get_all_repos", return_value=[("repo", repo_path)]),
             patch("grv.cli.get_repo_branches_fast", return_value=[branch_info]),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", return_value=safe_status),
             patch("subprocess.run"),
         ):
             result = runner.invoke(main, ["clean", "--force"])
             assert "Cleaned 1 worktree" in result.output
 
+    def test_clean_branch_with_slashes(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GRV_ROOT", str(tmp_path))
+        repo_path = tmp_path / "repo"
+        branch_path = repo_path / "tree_branches" / "feature" / "foo"
+        branch_info = BranchInfo(name="feature/foo", path=branch_path)
+        safe_status = BranchStatus(
+            name="feature/foo",
+            path=branch_path,
+            has_remote=True,
+            is_merged=True,
+            unpushed_commits=0,
+            uncommitted_changes=0,
+            insertions=0,
+            deletions=0,
+        )
+        with (
+            patch("grv.cli.get_all_repos", return_value=[("repo", repo_path)]),
+            patch("grv.cli.get_repo_branches_fast", return_value=[branch_info]),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
+            patch("grv.cli.get_branch_status", return_value=safe_status),
+            patch("grv.cli.remove_worktrees") as mock_remove,
+        ):
+            result = runner.invoke(main, ["clean", "--force"])
+            assert "Cleaned 1 worktree" in result.output
+            mock_remove.assert_called_once_with(
+                repo_path / "trunk", [(branch_path, "feature/foo")]
+            )
+
     def test_clean_abort(
         self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -455,6 +529,7 @@ class TestClean:
         with (
             patch("grv.cli.get_all_repos", return_value=[("repo", tmp_path)]),
             patch("grv.cli.get_repo_branches_fast", return_value=[branch_info]),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", return_value=safe_status),
         ):
             result = runner.invoke(main, ["clean"], input="n\n")
@@ -487,7 +562,9 @@ class TestClean:
             deletions=0,
         )
 
-        def mock_status(_path: Path, _trunk: Path, name: str) -> BranchStatus:
+        def mock_status(
+            _path: Path, _trunk: Path, name: str, _meta: object
+        ) -> BranchStatus:
             return clean_status if name == "cleanable" else dirty_status
 
         with (
@@ -496,6 +573,7 @@ class TestClean:
                 "grv.cli.get_repo_branches_fast",
                 return_value=[clean_info, dirty_info],
             ),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", side_effect=mock_status),
         ):
             result = runner.invoke(main, ["clean", "--dry-run"])
@@ -503,6 +581,39 @@ class TestClean:
             assert "dirty" not in result.output
             assert "Would remove 1 worktree" in result.output
 
+    def test_clean_preserves_branch_order(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GRV_ROOT", str(tmp_path))
+        names = [f"branch-{i:02d}" for i in range(20)]
+        infos = [BranchInfo(name=n, path=tmp_path / n) for n in names]
+
+        def mock_status(
+            path: Path, _trunk: Path, name: str, _meta: object
+        ) -> BranchStatus:
+            return BranchStatus(
+                name=name,
+                path=path,
+                has_remote=True,
+                is_merged=True,
+                unpushed_commits=0,
+                uncommitted_changes=0,
+                insertions=0,
+                deletions=0,
+            )
+
+        with (
+            patch("grv.cli.get_all_repos", return_value=[("repo", tmp_path)]),
+            patch("grv.cli.get_repo_branches_fast", return_value=infos),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
+            patch("grv.cli.get_branch_status", side_effect=mock_status),
+        ):
+            result = runner.invoke(main, ["clean", "--dry-run"])
+            assert "Scanning branch 20/20... done" in result.output
+            positions = [result.output.index(f"{n} (") for n in names]
+            assert positions == sorted(positions)
+            assert "Would remove 20 worktree" in result.output
+
     def test_clean_removes_empty_repo(
         self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -532,8 +643,9 @@ class TestClean:
         with (
             patch("grv.cli.get_all_repos", return_value=[("repo", repo_path)]),
             patch("grv.cli.get_repo_branches_fast", side_effect=mock_branches_fast),
+            patch("grv.cli.get_repo_branch_metadata", return_value={}),
             patch("grv.cli.get_branch_status", return_value=safe_status),
-            patch("subprocess.run"),
+            patch("grv.cli.remove_worktrees"),
         ):
             result = runner.invoke(main, ["clean", "--force"])
             assert "Cleaned 1 worktree" in result.output
@@ -45,3 +45,14 @@ class TestExtractRepoId:
     def test_trailing_slash(self) -> None:
         result = extract_repo_id("https://github.com/user/repo/")
         assert result == "github_com_user_repo"
+
+    def test_ssh_url_with_port_separator(self) -> None:
+        result = extract_repo_id("git@host.example.com:8022:team/repo.git")
+        assert result == "host_example_com_8022_team_repo"
+
+    def test_memoized(self) -> None:
+        url = "https://example.com/memo/repo.git"
+        first = extract_repo_id(url)
+        hits = extract_repo_id.cache_info().hits
+        assert extract_repo_id(url) is first
+        assert extract_repo_id.cache_info().hits == hits + 1
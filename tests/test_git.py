@@ -1,11 +1,13 @@
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from grv.git import (
-    branch_exists_locally,
+    branch_refs,
     ensure_base_repo,
     ensure_worktree,
     get_default_branch,
+    remove_worktrees,
     run_git,
 )
 
@@ -41,17 +43,103 @@ class TestGetDefaultBranch:
             result = get_default_branch(tmp_path)
             assert result == "master"
 
+    def test_reads_symref_file(self, tmp_path: Path) -> None:
+        ref_file = tmp_path / ".git" / "refs" / "remotes" / "origin" / "HEAD"
+        ref_file.parent.mkdir(parents=True)
+        ref_file.write_text("ref: refs/remotes/origin/develop\n")
+        with patch("grv.git.run_git") as mock:
+            assert get_default_branch(tmp_path) == "develop"
+            mock.assert_not_called()
+
+    def test_reads_symref_from_worktree_common_dir(self, tmp_path: Path) -> None:
+        common = tmp_path / "trunk" / ".git"
+        ref_file = common / "refs" / "remotes" / "origin" / "HEAD"
+        ref_file.parent.mkdir(parents=True)
+        ref_file.write_text("ref: refs/remotes/origin/main\n")
+        git_dir = common / "worktrees" / "feature"
+        git_dir.mkdir(parents=True)
+        (git_dir / "commondir").write_text("../..\n")
+        tree = tmp_path / "feature"
+        tree.mkdir()
+        (tree / ".git").write_text(f"gitdir: {git_dir}\n")
+        with patch("grv.git.run_git") as mock:
+            assert get_default_branch(tree) == "main"
+            mock.assert_not_called()
+
+    def test_falls_back_when_not_symref(self, tmp_path: Path) -> None:
+        ref_file = tmp_path / ".git" / "refs" / "remotes" / "origin" / "HEAD"
+        ref_file.parent.mkdir(parents=True)
+        ref_file.write_text("0123abcd\n")
+        with patch("grv.git.run_git") as mock:
+            mock.return_value = MagicMock(
+                stdout="refs/remotes/origin/main\n", returncode=0
+            )
+            assert get_default_branch(tmp_path) == "main"
+
+    def test_memoized_until_symref_changes(self, tmp_path: Path) -> None:
+        ref_file = tmp_path / ".git" / "refs" / "remotes" / "origin" / "HEAD"
+        ref_file.parent.mkdir(parents=True)
+        ref_file.write_text("ref: refs/remotes/origin/main\n")
+        with patch.object(Path, "read_text", wraps=ref_file.read_text) as reads:
+            assert get_default_branch(tmp_path) == "main"
+            assert get_default_branch(tmp_path) == "main"
+            assert reads.call_count == 1
+        ref_file.write_text("ref: refs/remotes/origin/trunk\n")
+        stat = ref_file.stat()
+        os.utime(ref_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert get_default_branch(tmp_path) == "trunk"
+
+
+class TestBranchRefs:
+    def test_local_and_remote(self, tmp_path: Path) -> None:
+        with patch("grv.git.run_git") as mock:
+            mock.return_value = MagicMock(
+                stdout="refs/heads/main\nrefs/remotes/origin/main\n", returncode=0
+            )
+            assert branch_refs(tmp_path, "main") == (True, True)
+            mock.assert_called_once()
+            assert mock.call_args.args[-2:] == (
+                "refs/heads/main",
+                "refs/remotes/origin/main",
+            )
+
+    def test_remote_only(self, tmp_path: Path) -> None:
+        with patch("grv.git.run_git") as mock:
+            mock.return_value = MagicMock(
+                stdout="refs/remotes/origin/feature\n", returncode=0
+            )
+            assert branch_refs(tmp_path, "feature") == (False, True)
+
+    def test_ignores_nested_refs(self, tmp_path: Path) -> None:
+        # for-each-ref patterns also match refs below a slash
+        with patch("grv.git.run_git") as mock:
+            mock.return_value = MagicMock(
+                stdout="refs/heads/feature/sub\n", returncode=0
+            )
+            assert branch_refs(tmp_path, "feature") == (False, False)
 
-class TestBranchExistsLocally:
-    def test_branch_exists(self, tmp_path: Path) -> None:
+
+class TestRemoveWorktrees:
+    def test_single_shell_for_all_worktrees(self, tmp_path: Path) -> None:
+        worktrees = [(tmp_path / "a", "a"), (tmp_path / "my dir", "feat/b")]
         with patch("subprocess.run") as mock:
-            mock.return_value = MagicMock(returncode=0)
-            assert branch_exists_locally(tmp_path, "main") is True
+            remove_worktrees(tmp_path, worktrees)
+            mock.assert_called_once()
+            cmd = mock.call_args.args[0]
+            assert cmd[:2] == ["sh", "-c"]
+            assert cmd[2] == (
+                f"git worktree remove {tmp_path / 'a'} && git branch -d a; "
+                f"git worktree remove '{tmp_path / 'my dir'}' && git branch -d feat/b"
+            )
+            assert mock.call_args.kwargs["cwd"] == tmp_path
 
-    def test_branch_not_exists(self, tmp_path: Path) -> None:
+    def test_force(self, tmp_path: Path) -> None:
         with patch("subprocess.run") as mock:
-            mock.return_value = MagicMock(returncode=1)
-            assert branch_exists_locally(tmp_path, "nonexistent") is False
+            remove_worktrees(tmp_path, [(tmp_path / "a", "a")], force=True)
+            script = mock.call_args.args[0][2]
+            assert script == (
+                f"git worktree remove --force {tmp_path / 'a'} && git branch -D a"
+            )
 
 
 class TestEnsureBaseRepo:
@@ -90,7 +178,7 @@ class TestEnsureWorktree:
         base_path.mkdir()
         tree_path = tmp_path / "tree"
         with (
-            patch("grv.git.branch_exists_locally", return_value=True),
+            patch("grv.git.branch_refs", return_value=(True, False)),
             patch("grv.git.run_git") as mock_git,
         ):
             ensure_worktree(base_path, tree_path, "feature")
@@ -102,13 +190,13 @@ class TestEnsureWorktree:
         base_path.mkdir()
         tree_path = tmp_path / "tree"
         with (
-            patch("grv.git.branch_exists_locally", return_value=False),
+            patch("grv.git.branch_refs", return_value=(False, True)),
             patch("grv.git.run_git") as mock_git,
         ):
-            mock_git.return_value = MagicMock(
-                stdout="abc123 refs/heads/feature\n", returncode=0
-            )
             ensure_worktree(base_path, tree_path, "feature")
+            mock_git.assert_called_once()
+            assert "--track" in mock_git.call_args.args
+            assert mock_git.call_args.args[-1] == "origin/feature"
 
     def test_create_worktree_new_branch_uses_remote_default(
         self, tmp_path: Path
@@ -124,7 +212,7 @@ class TestEnsureWorktree:
         base_path.mkdir()
         tree_path = tmp_path / "tree"
         with (
-            patch("grv.git.branch_exists_locally", return_value=False),
+            patch("grv.git.branch_refs", return_value=(False, False)),
             patch("grv.git.run_git") as mock_git,
             patch("grv.git.get_default_branch", return_value="main"),
         ):
@@ -153,7 +241,7 @@ class TestEnsureWorktree:
         base_path.mkdir()
         tree_path = tmp_path / "tree"
         with (
-            patch("grv.git.branch_exists_locally", return_value=False),
+            patch("grv.git.branch_refs", return_value=(False, False)),
             patch("grv.git.run_git") as mock_git,
             patch("grv.git.get_default_branch", return_value="master"),
         ):
@@ -178,7 +266,7 @@ class TestEnsureWorktree:
         base_path.mkdir()
         tree_path = tmp_path / "tree"
         with (
-            patch("grv.git.branch_exists_locally", return_value=False),
+            patch("grv.git.branch_refs", return_value=(False, False)),
             patch("grv.git.run_git") as mock_git,
         ):
             mock_git.return_value = MagicMock(stdout="", returncode=0)
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from grv.gitdir import common_git_dir, resolve_git_dir
+
+
+class TestResolveGitDir:
+    def test_plain_checkout(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        assert resolve_git_dir(tmp_path) == tmp_path / ".git"
+
+    def test_linked_worktree_absolute(self, tmp_path: Path) -> None:
+        git_dir = tmp_path / "trunk" / ".git" / "worktrees" / "feature"
+        (tmp_path / ".git").write_text(f"gitdir: {git_dir}\n")
+        assert resolve_git_dir(tmp_path) == git_dir
+
+    def test_linked_worktree_relative(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").write_text("gitdir: ../trunk/.git/worktrees/x\n")
+        assert resolve_git_dir(tmp_path) == tmp_path / "../trunk/.git/worktrees/x"
+
+
+class TestCommonGitDir:
+    def test_plain_checkout(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        assert common_git_dir(tmp_path) == tmp_path / ".git"
+
+    def test_linked_worktree(self, tmp_path: Path) -> None:
+        git_dir = tmp_path / "trunk" / ".git" / "worktrees" / "feature"
+        git_dir.mkdir(parents=True)
+        (git_dir / "commondir").write_text("../..\n")
+        tree = tmp_path / "feature"
+        tree.mkdir()
+        (tree / ".git").write_text(f"gitdir: {git_dir}\n")
+        assert common_git_dir(tree) == git_dir / "../.."
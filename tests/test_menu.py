@@ -24,6 +24,24 @@ class TestBuildMenuEntries:
             assert "main" in entries[1][0]
             assert entries[1][1] == branch
 
+    def test_lists_branches_once_per_repo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("GRV_ROOT", str(tmp_path))
+        branch = BranchInfo(name="main", path=tmp_path / "main")
+        repos = [("a", tmp_path / "a"), ("b", tmp_path / "b")]
+        with (
+            patch("grv.menu.get_all_repos", return_value=repos),
+            patch(
+                "grv.menu.get_repo_branches_fast", return_value=[branch]
+            ) as mock_branches,
+        ):
+            entries = build_menu_entries()
+            assert len(entries) == 4
+            assert entries[0][0].endswith("a")
+            assert entries[2][0].endswith("b")
+            assert mock_branches.call_count == 2
+
     def test_empty_repos(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("GRV_ROOT", str(tmp_path))
         with patch("grv.menu.get_all_repos", return_value=[]):
@@ -5,9 +5,11 @@ import pytest
 
 from grv.status import (
     BranchInfo,
+    BranchRefs,
     BranchStatus,
     get_all_repos,
     get_branch_status,
+    get_repo_branch_metadata,
     get_repo_branches,
     get_repo_branches_fast,
 )
@@ -67,87 +69,192 @@ class TestBranchStatus:
         assert status.is_safe_to_clean is False
 
 
-class TestGetBranchStatus:
-    def test_with_remote_and_merged(self, tmp_path: Path) -> None:
+def _refs(
+    has_remote: bool = True, is_merged: bool = False, ahead: int | None = 0
+) -> dict[str, BranchRefs]:
+    return {"feature": BranchRefs(has_remote, is_merged, ahead)}
+
+
+class TestGetRepoBranchMetadata:
+    def test_parses_refs(self, tmp_path: Path) -> None:
+        refs = "\n".join(
+            [
+                "refs/heads/feature\0refs/remotes/origin/feature\0",
+                "refs/heads/ahead\0refs/remotes/origin/ahead\0[ahead 3, behind 1]",
+                "refs/heads/gone\0refs/remotes/origin/gone\0[gone]",
+                "refs/heads/local\0refs/remotes/origin/main\0[ahead 2]",
+                "refs/heads/untracked\0\0",
+            ]
+        )
+        heads = "\n".join(
+            [
+                "abc123\trefs/heads/main",
+                "abc123\trefs/heads/feature",
+                "def456\trefs/heads/ahead",
+                "def456\trefs/heads/untracked",
+            ]
+        )
+
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
+            if "--merged" in cmd:
+                assert "origin/main" in cmd
+                return MagicMock(stdout="feature\ngone\n", returncode=0)
             if "ls-remote" in cmd:
-                return MagicMock(stdout="abc123 refs/heads/feature\n", returncode=0)
-            if "branch" in cmd and "--merged" in cmd:
-                return MagicMock(stdout="  feature\n  main\n", returncode=0)
-            if "rev-list" in cmd:
-                return MagicMock(stdout="0\n", returncode=0)
-            if "diff" in cmd:
-                return MagicMock(stdout="", returncode=0)
+                return MagicMock(stdout=heads, returncode=0)
+            if "for-each-ref" in cmd:
+                return MagicMock(stdout=refs, returncode=0)
             return MagicMock(stdout="", returncode=0)
 
+        with (
+            patch("subprocess.run", side_effect=mock_run) as mock_sub,
+            patch("grv.status.get_default_branch", return_value="main"),
+        ):
+            metadata = get_repo_branch_metadata(tmp_path)
+            assert mock_sub.call_count == 3
+
+        assert metadata == {
+            "feature": BranchRefs(has_remote=True, is_merged=True, ahead=0),
+            "ahead": BranchRefs(has_remote=True, is_merged=False, ahead=3),
+            "gone": BranchRefs(has_remote=False, is_merged=True, ahead=None),
+            "local": BranchRefs(has_remote=False, is_merged=False, ahead=None),
+            "untracked": BranchRefs(has_remote=True, is_merged=False, ahead=None),
+        }
+
+    def test_stale_tracking_ref_has_no_remote(self, tmp_path: Path) -> None:
+        # origin/feature is still present locally but the remote deleted it
+        refs = "refs/heads/feature\0refs/remotes/origin/feature\0"
+
+        def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
+            if "ls-remote" in cmd:
+                return MagicMock(stdout="abc123\trefs/heads/main\n", returncode=0)
+            if "for-each-ref" in cmd:
+                return MagicMock(stdout=refs, returncode=0)
+            return MagicMock(stdout="feature\n", returncode=0)
+
         with (
             patch("subprocess.run", side_effect=mock_run),
             patch("grv.status.get_default_branch", return_value="main"),
         ):
-            status = get_branch_status(tmp_path, tmp_path, "feature")
+            metadata = get_repo_branch_metadata(tmp_path)
+
+        assert metadata == {
+            "feature": BranchRefs(has_remote=False, is_merged=True, ahead=None)
+        }
+
+
+class TestGetBranchStatus:
+    def test_with_remote_and_merged(self, tmp_path: Path) -> None:
+        with (
+            patch(
+                "subprocess.run", return_value=MagicMock(stdout="", returncode=0)
+            ) as mock_run,
+            patch("grv.status.get_default_branch") as mock_default,
+        ):
+            status = get_branch_status(
+                tmp_path, tmp_path, "feature", _refs(is_merged=True)
+            )
             assert status.has_remote is True
             assert status.is_merged is True
             assert status.unpushed_commits == 0
+            # Only the worktree diff runs; ref state comes from metadata
+            mock_run.assert_called_once()
+            mock_default.assert_not_called()
+
+    def test_ahead_from_metadata(self, tmp_path: Path) -> None:
+        with patch("subprocess.run", return_value=MagicMock(stdout="", returncode=0)):
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs(ahead=4))
+            assert status.unpushed_commits == 4
 
     def test_no_remote(self, tmp_path: Path) -> None:
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
-            if "ls-remote" in cmd:
-                return MagicMock(stdout="", returncode=0)
-            if "branch" in cmd:
-                return MagicMock(stdout="", returncode=0)
             if "rev-list" in cmd:
+                assert "origin/main..feature" in cmd
                 return MagicMock(stdout="2\n", returncode=0)
-            if "diff" in cmd:
-                return MagicMock(stdout="", returncode=0)
             return MagicMock(stdout="", returncode=0)
 
         with (
             patch("subprocess.run", side_effect=mock_run),
             patch("grv.status.get_default_branch", return_value="main"),
         ):
-            status = get_branch_status(tmp_path, tmp_path, "feature")
+            status = get_branch_status(
+                tmp_path, tmp_path, "feature", _refs(has_remote=False, ahead=None)
+            )
             assert status.has_remote is False
             assert status.unpushed_commits == 2
 
-    def test_with_uncommitted_changes(self, tmp_path: Path) -> None:
+    def test_remote_without_tracking(self, tmp_path: Path) -> None:
+        def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
+            if "rev-list" in cmd:
+                assert "origin/feature..feature" in cmd
+                return MagicMock(stdout="1\n", returncode=0)
+            return MagicMock(stdout="", returncode=0)
+
+        with (
+            patch("subprocess.run", side_effect=mock_run),
+            patch("grv.status.get_default_branch") as mock_default,
+        ):
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs(ahead=None))
+            assert status.has_remote is True
+            assert status.unpushed_commits == 1
+            mock_default.assert_not_called()
+
+    def test_unknown_branch_has_no_remote(self, tmp_path: Path) -> None:
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
-            if "ls-remote" in cmd:
-                return MagicMock(stdout="abc refs/heads/f\n", returncode=0)
-            if "branch" in cmd:
-                return MagicMock(stdout="", returncode=0)
             if "rev-list" in cmd:
                 return MagicMock(stdout="0\n", returncode=0)
-            if "diff" in cmd:
-                diff_out = " f.py | 5 ++---\n 1 file, 2 insertions(+), 3 deletions(-)\n"
-                return MagicMock(stdout=diff_out, returncode=0)
             return MagicMock(stdout="", returncode=0)
 
         with (
             patch("subprocess.run", side_effect=mock_run),
             patch("grv.status.get_default_branch", return_value="main"),
+        ):
+            status = get_branch_status(tmp_path, tmp_path, "feature", {})
+            assert status.has_remote is False
+            assert status.is_merged is False
+
+    def test_computes_metadata_when_missing(self, tmp_path: Path) -> None:
+        with (
+            patch("subprocess.run", return_value=MagicMock(stdout="", returncode=0)),
+            patch(
+                "grv.status.get_repo_branch_metadata", return_value=_refs()
+            ) as mock_meta,
         ):
             status = get_branch_status(tmp_path, tmp_path, "feature")
+            mock_meta.assert_called_once_with(tmp_path)
+            assert status.has_remote is True
+
+    def test_with_uncommitted_changes(self, tmp_path: Path) -> None:
+        def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
+            if "diff-index" in cmd:
+                return MagicMock(returncode=1)
+            if "diff" in cmd:
+                diff_out = "1\t3\tf.py\n1\t0\tdir/with\ttab.py\n"
+                return MagicMock(stdout=diff_out, returncode=0)
+            return MagicMock(stdout="", returncode=0)
+
+        with patch("subprocess.run", side_effect=mock_run):
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs())
             assert status.insertions == 2
             assert status.deletions == 3
             assert status.uncommitted_changes == 5
 
+    def test_clean_worktree_skips_numstat(self, tmp_path: Path) -> None:
+        with patch(
+            "subprocess.run", return_value=MagicMock(stdout="", returncode=0)
+        ) as mock_run:
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs())
+            assert status.uncommitted_changes == 0
+            mock_run.assert_called_once()
+            assert mock_run.call_args.args[0][:2] == ["git", "diff-index"]
+
     def test_rev_list_failure(self, tmp_path: Path) -> None:
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
-            if "ls-remote" in cmd:
-                return MagicMock(stdout="abc refs/heads/f\n", returncode=0)
-            if "branch" in cmd:
-                return MagicMock(stdout="", returncode=0)
             if "rev-list" in cmd:
                 return MagicMock(stdout="", returncode=1)
-            if "diff" in cmd:
-                return MagicMock(stdout="", returncode=0)
             return MagicMock(stdout="", returncode=0)
 
-        with (
-            patch("subprocess.run", side_effect=mock_run),
-            patch("grv.status.get_default_branch", return_value="main"),
-        ):
-            status = get_branch_status(tmp_path, tmp_path, "feature")
+        with patch("subprocess.run", side_effect=mock_run):
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs(ahead=None))
             assert status.unpushed_commits == 0
 
 
@@ -216,6 +323,7 @@ class TestGetRepoBranches:
 
         with (
             patch("subprocess.run", side_effect=mock_run),
+            patch("grv.status.get_repo_branch_metadata", return_value={}),
             patch("grv.status.get_branch_status") as mock_status,
         ):
             mock_status.return_value = BranchStatus(
@@ -268,6 +376,7 @@ class TestGetRepoBranches:
 
         with (
             patch("subprocess.run", side_effect=mock_run),
+            patch("grv.status.get_repo_branch_metadata", return_value={}),
             patch("grv.status.get_branch_status") as mock_status,
         ):
             mock_status.return_value = BranchStatus(
@@ -284,7 +393,7 @@ class TestGetRepoBranches:
             assert len(result) == 1
             assert result[0].name == "feature/foo"
             # Verify get_branch_status was called with correct branch name
-            mock_status.assert_called_once_with(branch, trunk, "feature/foo")
+            mock_status.assert_called_once_with(branch, trunk, "feature/foo", {})
 
 
 class TestGetRepoBranchesFast:
@@ -408,26 +517,22 @@ class TestGetRepoBranchesFast:
 
 
 class TestEdgeCases:
-    def test_diff_with_no_summary_line(self, tmp_path: Path) -> None:
-        """Test when diff output has no insertion/deletion summary."""
+    def test_diff_with_binary_files(self, tmp_path: Path) -> None:
+        """Binary files have no line counts in numstat output."""
 
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
-            if "ls-remote" in cmd:
-                return MagicMock(stdout="abc refs/heads/f\n", returncode=0)
-            if "branch" in cmd:
-                return MagicMock(stdout="", returncode=0)
-            if "rev-list" in cmd:
-                return MagicMock(stdout="0\n", returncode=0)
+            if "diff-index" in cmd:
+                return MagicMock(returncode=1)
             if "diff" in cmd:
-                return MagicMock(stdout="file.txt\n", returncode=0)
+                out = "-\t-\timage.png\n1\t0\tnotes.txt\n"
+                return MagicMock(stdout=out, returncode=0)
             return MagicMock(stdout="", returncode=0)
 
-        with (
-            patch("subprocess.run", side_effect=mock_run),
-            patch("grv.status.get_default_branch", return_value="main"),
-        ):
-            status = get_branch_status(tmp_path, tmp_path, "feature")
-            assert status.uncommitted_changes == 0
+        with patch("subprocess.run", side_effect=mock_run):
+            status = get_branch_status(tmp_path, tmp_path, "feature", _refs())
+            assert status.insertions == 1
+            assert status.deletions == 0
+            assert status.uncommitted_changes == 1
 
     def test_repos_with_file_not_dir(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -457,6 +562,7 @@ class TestEdgeCases:
         """Test when git worktree list fails."""
         trunk = tmp_path / "trunk"
         trunk.mkdir()
+        (tmp_path / "tree_branches").mkdir()
 
         def mock_run(cmd: list[str], **_kw: object) -> MagicMock:
             if "worktree" in cmd:
@@ -481,7 +587,8 @@ class TestEdgeCases:
                 return MagicMock(stdout=output, returncode=0)
             return MagicMock(stdout="", returncode=0)
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch("subprocess.run", side_effect=mock_run) as mock_sub:
             result = get_repo_branches_fast(tmp_path)
             # Should return empty because tree_branches_dir.exists() is False
             assert result == []
+            mock_sub.assert_not_called()